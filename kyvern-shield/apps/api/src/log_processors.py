@@ -0,0 +1,26 @@
+"""
+structlog processors for Kyvern Shield.
+
+Processors only run for events that pass the level filter, so formatting
+done here costs nothing when the level is disabled. Hot paths log raw
+values and leave the presentation to these processors.
+"""
+
+from typing import Any
+from uuid import UUID
+
+# Event keys holding Solana addresses, shortened for log output
+ADDRESS_KEYS = ("target", "address")
+ADDRESS_PREFIX_LENGTH = 20
+
+
+def shorten_intent_fields(_logger: Any, _method_name: str, event_dict: dict[str, Any]) -> dict[str, Any]:
+    """Truncate address fields and render UUIDs as plain strings."""
+    for key in ADDRESS_KEYS:
+        value = event_dict.get(key)
+        if isinstance(value, str) and len(value) > ADDRESS_PREFIX_LENGTH:
+            event_dict[key] = value[:ADDRESS_PREFIX_LENGTH] + "..."
+    for key, value in event_dict.items():
+        if isinstance(value, UUID):
+            event_dict[key] = str(value)
+    return event_dict
@@ -13,6 +13,7 @@ from prometheus_client import make_asgi_app
 
 from src.routes import agents, alerts, analysis, api_keys, health, transactions
 from src.config import settings
+from src.log_processors import shorten_intent_fields
 
 # Configure structured logging
 structlog.configure(
@@ -21,6 +22,7 @@ structlog.configure(
         structlog.stdlib.add_logger_name,
         structlog.stdlib.add_log_level,
         structlog.stdlib.PositionalArgumentsFormatter(),
+        shorten_intent_fields,
         structlog.processors.TimeStamper(fmt="iso"),
         structlog.processors.StackInfoRenderer(),
         structlog.processors.format_exc_info,
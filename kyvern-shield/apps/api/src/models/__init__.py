@@ -4,6 +4,8 @@ from src.models.intent import (
     TransactionIntent,
     AnalysisDecision,
     AnalysisResult,
+    BatchAnalysisItem,
+    BatchItemError,
     HeuristicResult,
     LLMAnalysisResult,
     RogueAgentRequest,
@@ -14,6 +16,8 @@ __all__ = [
     "TransactionIntent",
     "AnalysisDecision",
     "AnalysisResult",
+    "BatchAnalysisItem",
+    "BatchItemError",
     "HeuristicResult",
     "LLMAnalysisResult",
     "RogueAgentRequest",
@@ -2,7 +2,7 @@
 
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import Any, Optional
 from uuid import UUID, uuid4
 
 from pydantic import BaseModel, Field
@@ -206,6 +206,28 @@ class AnalysisResult(BaseModel):
     }
 
 
+class BatchItemError(BaseModel):
+    """Error for a single intent in a batch analysis request."""
+
+    status_code: int = Field(description="HTTP status the intent would have received on its own")
+    detail: Any = Field(description="Error detail, as returned by POST /intent")
+
+
+class BatchAnalysisItem(BaseModel):
+    """
+    Outcome for one intent in a batch analysis request.
+
+    Exactly one of `result` and `error` is set.
+    """
+
+    result: AnalysisResult | None = Field(
+        default=None, description="Analysis result, if the intent was analyzed"
+    )
+    error: BatchItemError | None = Field(
+        default=None, description="Why the intent could not be analyzed"
+    )
+
+
 class RogueAgentRequest(BaseModel):
     """
     Request model for simulating rogue agent transactions.
@@ -7,12 +7,14 @@ These endpoints provide the core Shield functionality:
 - Manage blacklist entries
 """
 
+import asyncio
 from collections import deque
 from typing import Any, Optional
 from uuid import uuid4
 
 import structlog
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Body, Depends, HTTPException, Query
+from pydantic import ValidationError
 
 from src.db.blacklist import get_blacklist_db
 from src.services.auth import APIKeyAuth, verify_api_key
@@ -42,6 +44,8 @@ from src.models.blacklist import (
 from src.models.intent import (
     AnalysisDecision,
     AnalysisResult,
+    BatchAnalysisItem,
+    BatchItemError,
     HeuristicResult,
     RogueAgentRequest,
     SourceDetectionResult,
@@ -227,6 +231,53 @@ async def analyze_intent(
         )
 
 
+MAX_BATCH_SIZE = 100
+
+
+async def _analyze_batch_item(raw_intent: Any, auth: APIKeyAuth) -> BatchAnalysisItem:
+    """Validate and analyze one batch entry, capturing its error instead of raising."""
+    try:
+        intent = TransactionIntent.model_validate(raw_intent)
+    except ValidationError as e:
+        return BatchAnalysisItem(
+            error=BatchItemError(
+                status_code=422,
+                detail=e.errors(include_url=False, include_context=False),
+            )
+        )
+
+    try:
+        return BatchAnalysisItem(result=await analyze_intent(intent, auth))
+    except HTTPException as e:
+        return BatchAnalysisItem(
+            error=BatchItemError(status_code=e.status_code, detail=e.detail)
+        )
+
+
+@router.post(
+    "/intent:batch",
+    response_model=list[BatchAnalysisItem],
+    summary="Analyze a Batch of Transaction Intents",
+    description=f"""
+    Submit up to {MAX_BATCH_SIZE} transaction intents in one request.
+
+    **Authentication Required**: Include `X-API-Key` header with a valid API key.
+
+    Each intent runs through the same pipeline as `POST /intent`. Entries are
+    returned in request order, each holding either a `result` or an `error`
+    (with the status and detail `POST /intent` would have returned), so one
+    invalid or failing intent doesn't fail the rest of the batch.
+    """,
+)
+async def analyze_intent_batch(
+    intents: list[Any] = Body(..., max_length=MAX_BATCH_SIZE),
+    auth: APIKeyAuth = Depends(verify_api_key),
+) -> list[BatchAnalysisItem]:
+    """Analyze several transaction intents, saving a round trip per intent."""
+    # Items are validated one by one so a bad entry only fails itself
+    return list(await asyncio.gather(*(_analyze_batch_item(raw, auth) for raw in intents)))
+
+
 # =============================================================================
 # Rogue Agent Simulation (Testing)
 # =============================================================================
@@ -133,11 +133,13 @@ class TransactionAnalyzer:
         start_time = time.perf_counter()
         sandbox_warnings: list[SandboxWarning] = []
 
+        # Raw values: shortening and str() happen in the logging pipeline,
+        # only if the event is emitted (see src.log_processors)
         logger.info(
             "Starting transaction analysis",
-            request_id=str(intent.request_id),
-            agent_id=str(intent.agent_id),
-            target=intent.target_address[:20] + "...",
+            request_id=intent.request_id,
+            agent_id=intent.agent_id,
+            target=intent.target_address,
             amount=intent.amount_sol,
         )
 
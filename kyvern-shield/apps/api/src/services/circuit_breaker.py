@@ -9,16 +9,15 @@ program deployed on Solana. It allows the API to:
 4. Query shield state
 """
 
-import asyncio
-import base64
 import json
+import struct
 from dataclasses import dataclass
 from enum import IntEnum
-from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import structlog
-from solana.rpc.async_api import AsyncClient
+from borsh_construct import I64, U8, U64, CStruct, Vec
+from construct import Bytes
 from solana.rpc.commitment import Confirmed
 from solders.keypair import Keypair
 from solders.transaction import Transaction
@@ -28,10 +27,16 @@ from solders.instruction import Instruction, AccountMeta
 
 from src.config import settings
 
+if TYPE_CHECKING:
+    from solana.rpc.async_api import AsyncClient
+
 logger = structlog.get_logger()
 
-# Circuit Breaker Program ID (deployed to devnet)
-CIRCUIT_BREAKER_PROGRAM_ID = Pubkey.from_string("6sqKVnqGaXxxBejFWRrAWv62wAaGUDedDYvm1mx1yH7J")
+# Circuit Breaker Program ID (deployed to devnet):
+# 6sqKVnqGaXxxBejFWRrAWv62wAaGUDedDYvm1mx1yH7J, stored pre-decoded to skip base58 at import
+CIRCUIT_BREAKER_PROGRAM_ID = Pubkey.from_bytes(
+    bytes.fromhex("57501c047d07b977bdda5e17e3382d8f38b5d5495e85638d20f298eb3afc2ecd")
+)
 
 # Instruction discriminators (first 8 bytes of sha256 hash of instruction name)
 INITIALIZE_DISCRIMINATOR = bytes([175, 175, 109, 31, 13, 152, 155, 237])
@@ -39,6 +44,54 @@ RECORD_TRANSACTION_DISCRIMINATOR = bytes([68, 82, 242, 174, 248, 87, 187, 249])
 TRIGGER_CIRCUIT_BREAKER_DISCRIMINATOR = bytes([45, 201, 96, 95, 82, 107, 133, 233])
 RESET_CIRCUIT_BREAKER_DISCRIMINATOR = bytes([171, 22, 69, 234, 168, 34, 81, 160])
 
+# Maximum encoded length of a trigger reason accepted on-chain
+MAX_REASON_BYTES = 256
+
+# Stock trigger reasons; their borsh-encoded payloads are built once at import
+KNOWN_REASONS = (
+    "manual",
+    "manual_override",
+    "anomaly_count_exceeded",
+    "prompt_injection_detected",
+    "blacklisted_address",
+)
+
+
+def _encode_reason(reason: str) -> bytes:
+    """Borsh-encode a reason string (u32 length prefix + UTF-8 bytes)."""
+    reason_bytes = reason.encode("utf-8")[:MAX_REASON_BYTES]
+    return struct.pack("<I", len(reason_bytes)) + reason_bytes
+
+
+_REASON_PAYLOADS = {reason: _encode_reason(reason) for reason in KNOWN_REASONS}
+
+# Borsh layout of the on-chain Shield account (after the 8-byte discriminator).
+# Mirrors `Shield` / `ShieldConfig` in programs/circuit-breaker/src/lib.rs.
+SHIELD_CONFIG_LAYOUT = CStruct(
+    "max_transaction_value" / U64,
+    "daily_spend_limit" / U64,
+    "approval_threshold" / U64,
+    "anomaly_threshold" / U8,
+    "time_window_seconds" / I64,
+    "cooldown_seconds" / I64,
+    "allowed_programs" / Vec(Bytes(32)),
+    "blocked_programs" / Vec(Bytes(32)),
+)
+
+SHIELD_LAYOUT = CStruct(
+    "authority" / Bytes(32),
+    "agent_wallet" / Bytes(32),
+    "config" / SHIELD_CONFIG_LAYOUT,
+    "state" / U8,  # CircuitState (unit enum, serialized as variant index)
+    "anomaly_count" / U8,
+    "last_triggered_at" / I64,
+    "cooldown_ends_at" / I64,
+    "total_transactions" / U64,
+    "blocked_transactions" / U64,
+    "created_at" / I64,
+    "bump" / U8,
+)
+
 
 class CircuitState(IntEnum):
     """On-chain circuit breaker states."""
@@ -58,7 +111,7 @@ class ShieldConfig:
     cooldown_seconds: int = 3600                 # 1 hour cooldown
 
 
-@dataclass
+@dataclass(frozen=True)
 class ShieldState:
     """Current state of a Shield account."""
     authority: str
@@ -70,6 +123,21 @@ class ShieldState:
     last_triggered_at: int
     cooldown_ends_at: int
 
+    @classmethod
+    def from_account_data(cls, data: bytes) -> "ShieldState":
+        """Decode raw Shield account data (including discriminator)."""
+        parsed = SHIELD_LAYOUT.parse(data[8:])
+        return cls(
+            authority=str(Pubkey.from_bytes(parsed.authority)),
+            agent_wallet=str(Pubkey.from_bytes(parsed.agent_wallet)),
+            state=CircuitState(parsed.state),
+            anomaly_count=parsed.anomaly_count,
+            total_transactions=parsed.total_transactions,
+            blocked_transactions=parsed.blocked_transactions,
+            last_triggered_at=parsed.last_triggered_at,
+            cooldown_ends_at=parsed.cooldown_ends_at,
+        )
+
 
 @dataclass
 class OnChainResult:
@@ -116,6 +184,9 @@ class CircuitBreakerService:
         if self._initialized:
             return
 
+        # Imported lazily: the RPC client stack is heavy and only needed once connected
+        from solana.rpc.async_api import AsyncClient
+
         self.client = AsyncClient(self.rpc_url, commitment=Confirmed)
 
         # Load authority keypair from settings if not provided
@@ -174,33 +245,12 @@ class CircuitBreakerService:
             if response.value is None:
                 return None
 
-            # Parse the account data
+            # Parse the account data in a single pass over the borsh layout
             data = response.value.data
             if len(data) < 100:
                 return None
 
-            # Skip 8-byte discriminator
-            offset = 8
-
-            # Parse fields (simplified - actual parsing depends on exact layout)
-            authority = Pubkey.from_bytes(data[offset:offset+32])
-            offset += 32
-
-            agent = Pubkey.from_bytes(data[offset:offset+32])
-            offset += 32
-
-            # Skip config (variable length)
-            # For now, just return basic info
-            return ShieldState(
-                authority=str(authority),
-                agent_wallet=str(agent),
-                state=CircuitState.CLOSED,  # Would need full parsing
-                anomaly_count=0,
-                total_transactions=0,
-                blocked_transactions=0,
-                last_triggered_at=0,
-                cooldown_ends_at=0,
-            )
+            return ShieldState.from_account_data(data)
 
         except Exception as e:
             logger.error("Failed to get shield state", error=str(e))
@@ -325,10 +375,8 @@ class CircuitBreakerService:
 
         try:
             # Build instruction data
-            reason_bytes = reason.encode('utf-8')[:256]  # Max 256 chars
-            instruction_data = bytearray(TRIGGER_CIRCUIT_BREAKER_DISCRIMINATOR)
-            instruction_data.extend(len(reason_bytes).to_bytes(4, 'little'))
-            instruction_data.extend(reason_bytes)
+            payload = _REASON_PAYLOADS.get(reason) or _encode_reason(reason)
+            instruction_data = TRIGGER_CIRCUIT_BREAKER_DISCRIMINATOR + payload
 
             instruction = Instruction(
                 program_id=CIRCUIT_BREAKER_PROGRAM_ID,
@@ -336,7 +384,7 @@ class CircuitBreakerService:
                     AccountMeta(shield_pda, is_signer=False, is_writable=True),
                     AccountMeta(self.authority.pubkey(), is_signer=True, is_writable=False),
                 ],
-                data=bytes(instruction_data),
+                data=instruction_data,
             )
 
             tx = Transaction()
@@ -5,12 +5,18 @@ This module provides fast, rule-based analysis of transaction intents
 before they are passed to the more expensive LLM analysis layer.
 """
 
-import re
 from dataclasses import dataclass
 from typing import Optional
 
 import structlog
 
+try:
+    # RE2 matches in linear time, so attacker-crafted reasoning cannot
+    # trigger catastrophic backtracking in the pattern scan.
+    import re2 as re
+except ImportError:  # pragma: no cover - platforms without google-re2 wheels
+    import re
+
 from src.db.blacklist import get_blacklist_db
 from src.models.intent import HeuristicResult, TransactionIntent
 
@@ -66,9 +72,10 @@ class HeuristicAnalyzer:
         self.config = config or HeuristicConfig()
         self.blacklist_db = get_blacklist_db()
 
-        # Compile regex patterns for efficiency
+        # Compile regex patterns for efficiency. Case-insensitivity is an
+        # inline flag since the re2 module has no flag constants.
         self._suspicious_patterns = [
-            re.compile(pattern, re.IGNORECASE)
+            re.compile(f"(?i){pattern}")
             for pattern in self.config.suspicious_patterns
         ]
 
@@ -100,8 +107,8 @@ class HeuristicAnalyzer:
             details.append(f"CRITICAL: Target address is blacklisted - {reason}")
             logger.warning(
                 "Blacklisted address detected",
-                agent_id=str(intent.agent_id),
-                address=intent.target_address[:20] + "...",
+                agent_id=intent.agent_id,
+                address=intent.target_address,
             )
         else:
             details.append("Address not on blacklist")
@@ -0,0 +1,100 @@
+"""Tests for the batch intent analysis endpoint."""
+
+from uuid import uuid4
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.models.intent import AnalysisDecision, AnalysisResult, HeuristicResult
+from src.routes import analysis
+from src.services.auth import APIKeyAuth, verify_api_key
+
+BATCH_PATH = "/api/v1/analysis/intent:batch"
+
+
+class FakeAnalyzer:
+    """Allows every intent, except ones whose reasoning asks it to fail."""
+
+    async def analyze(self, intent):
+        if "explode" in intent.reasoning:
+            raise RuntimeError("analyzer exploded")
+        return AnalysisResult(
+            request_id=intent.request_id,
+            decision=AnalysisDecision.ALLOW,
+            risk_score=10,
+            explanation="Looks fine",
+            heuristic_result=HeuristicResult(passed=True),
+            analysis_time_ms=1.0,
+        )
+
+
+@pytest.fixture
+def client(monkeypatch: pytest.MonkeyPatch) -> TestClient:
+    async def get_fake_analyzer() -> FakeAnalyzer:
+        return FakeAnalyzer()
+
+    monkeypatch.setattr(analysis, "get_transaction_analyzer", get_fake_analyzer)
+
+    app = FastAPI()
+    app.include_router(analysis.router, prefix="/api/v1/analysis")
+    app.dependency_overrides[verify_api_key] = lambda: APIKeyAuth(
+        key_id="key-1", user_id="user-1", key_name="test", key_prefix="sk_test"
+    )
+    return TestClient(app)
+
+
+def make_intent(**overrides: object) -> dict:
+    intent = {
+        "agent_id": str(uuid4()),
+        "target_address": "JUP6LkbZbjS1jKKwapdHNy74zcZ3tLUZoi5QNyVTaV4",
+        "amount_sol": 0.5,
+        "function_signature": "swap",
+        "reasoning": "Swapping 0.5 SOL for USDC as part of routine rebalancing.",
+    }
+    intent.update(overrides)
+    return intent
+
+
+def test_batch_returns_results_in_order(client: TestClient) -> None:
+    intents = [make_intent(), make_intent(amount_sol=1.5)]
+
+    response = client.post(BATCH_PATH, json=intents)
+
+    assert response.status_code == 200
+    items = response.json()
+    assert [item["error"] for item in items] == [None, None]
+    assert [item["result"]["decision"] for item in items] == ["allow", "allow"]
+
+
+def test_invalid_item_only_fails_itself(client: TestClient) -> None:
+    intents = [make_intent(), make_intent(target_address="X" * 46), make_intent()]
+
+    response = client.post(BATCH_PATH, json=intents)
+
+    assert response.status_code == 200
+    items = response.json()
+    assert items[0]["result"] is not None
+    assert items[1]["result"] is None
+    assert items[1]["error"]["status_code"] == 422
+    assert items[1]["error"]["detail"][0]["loc"] == ["target_address"]
+    assert items[2]["result"] is not None
+
+
+def test_failing_item_only_fails_itself(client: TestClient) -> None:
+    intents = [make_intent(reasoning="Please explode during this analysis."), make_intent()]
+
+    response = client.post(BATCH_PATH, json=intents)
+
+    assert response.status_code == 200
+    items = response.json()
+    assert items[0]["error"]["status_code"] == 500
+    assert items[1]["result"]["decision"] == "allow"
+
+
+def test_oversized_batch_is_rejected(client: TestClient) -> None:
+    intents = [make_intent()] * (analysis.MAX_BATCH_SIZE + 1)
+
+    response = client.post(BATCH_PATH, json=intents)
+
+    assert response.status_code == 422
@@ -0,0 +1,326 @@
+"""Tests for the LLM analysis layer."""
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from src.models.intent import TransactionIntent
+from src.services import llm_analyzer
+from src.services.llm_analyzer import LLMAnalyzer, LLMConfig, ProviderCircuitBreaker
+
+VALID_VERDICT = '{"risk_score": 12, "explanation": "Routine swap"}'
+
+# Valid JSON that is not a usable verdict object
+MALFORMED_VERDICTS = [
+    '{"risk_score": "high"}',
+    '{"risk_score": null}',
+    "[1, 2]",
+    "42",
+]
+
+
+class FakeProvider:
+    """
+    Stands in for the provider API.
+
+    Replays canned responses in order; an exception instance is raised
+    instead of returned. While `release` is set and cleared, calls wait on it.
+    """
+
+    def __init__(self, *responses: str | BaseException):
+        self.responses = list(responses)
+        self.calls = 0
+        self.release: asyncio.Event | None = None
+
+    async def generate(self, *_args, **_kwargs) -> str:
+        self.calls += 1
+        response = self.responses.pop(0) if len(self.responses) > 1 else self.responses[0]
+        if self.release is not None:
+            await self.release.wait()
+        if isinstance(response, BaseException):
+            raise response
+        return response
+
+
+async def always_available(_analyzer: LLMAnalyzer) -> bool:
+    return True
+
+
+def make_intent(**overrides: object) -> TransactionIntent:
+    intent = TransactionIntent(
+        agent_id=uuid4(),
+        target_address="JUP6LkbZbjS1jKKwapdHNy74zcZ3tLUZoi5QNyVTaV4",
+        amount_sol=0.5,
+        function_signature="swap",
+        reasoning="Swapping 0.5 SOL for USDC as part of routine portfolio rebalancing.",
+    )
+    return intent.model_copy(update=overrides)
+
+
+async def make_analyzer(
+    monkeypatch: pytest.MonkeyPatch,
+    provider: FakeProvider,
+    **config: object,
+) -> LLMAnalyzer:
+    """Build and start a Gemini analyzer backed by `provider`."""
+    monkeypatch.setattr(LLMAnalyzer, "_probe_gemini", always_available)
+    monkeypatch.setattr(LLMAnalyzer, "_generate_gemini", provider.generate)
+    analyzer = LLMAnalyzer(LLMConfig(provider="gemini", gemini_api_key="test-key", **config))
+    await analyzer.start()
+    return analyzer
+
+
+@pytest.mark.parametrize("raw_response", MALFORMED_VERDICTS)
+async def test_analyze_falls_back_on_malformed_verdict(
+    monkeypatch: pytest.MonkeyPatch, raw_response: str
+) -> None:
+    provider = FakeProvider(raw_response)
+    analyzer = await make_analyzer(monkeypatch, provider, breaker_fail_threshold=1)
+
+    result = await analyzer.analyze(make_intent())
+
+    assert result.risk_score == 50
+    assert result.explanation.startswith("LLM analysis incomplete")
+    assert result.raw_response == raw_response
+    # Counted as a provider failure: the breaker is now open
+    result = await analyzer.analyze(make_intent(amount_sol=1.0))
+    assert "circuit open" in result.explanation
+    assert provider.calls == 1
+    await analyzer.close()
+
+
+async def test_analyze_accepts_valid_verdict(monkeypatch: pytest.MonkeyPatch) -> None:
+    analyzer = await make_analyzer(monkeypatch, FakeProvider(VALID_VERDICT))
+
+    result = await analyzer.analyze(make_intent())
+
+    assert result.risk_score == 12
+    assert result.explanation == "Routine swap"
+    await analyzer.close()
+
+
+async def test_waiters_get_leader_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    provider = FakeProvider(RuntimeError("provider blew up"))
+    provider.release = asyncio.Event()
+    analyzer = await make_analyzer(monkeypatch, provider)
+    intent = make_intent()
+
+    leader = asyncio.create_task(analyzer.analyze(intent))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(analyzer.analyze(intent))
+    await asyncio.sleep(0)
+    provider.release.set()
+
+    results = await asyncio.gather(leader, follower, return_exceptions=True)
+
+    assert [type(r) for r in results] == [RuntimeError, RuntimeError]
+    assert provider.calls == 1
+    await analyzer.close()
+
+
+async def test_waiters_rerun_when_leader_is_cancelled(monkeypatch: pytest.MonkeyPatch) -> None:
+    provider = FakeProvider(VALID_VERDICT)
+    provider.release = asyncio.Event()
+    analyzer = await make_analyzer(monkeypatch, provider)
+    intent = make_intent()
+
+    leader = asyncio.create_task(analyzer.analyze(intent))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(analyzer.analyze(intent))
+    await asyncio.sleep(0)
+    leader.cancel()
+    await asyncio.sleep(0)
+    provider.release.set()
+
+    assert (await follower).explanation == "Routine swap"
+    assert leader.cancelled()
+    assert provider.calls == 2
+    await analyzer.close()
+
+
+async def test_singleton_is_built_and_started_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    checks = 0
+
+    async def check_availability(_analyzer: LLMAnalyzer) -> bool:
+        nonlocal checks
+        checks += 1
+        await asyncio.sleep(0)
+        return False
+
+    monkeypatch.setattr(LLMAnalyzer, "check_availability", check_availability)
+    monkeypatch.setattr(llm_analyzer, "_analyzer", None)
+
+    analyzers = await asyncio.gather(*(llm_analyzer.get_llm_analyzer() for _ in range(5)))
+
+    assert all(a is analyzers[0] for a in analyzers)
+    assert checks == 1
+    await analyzers[0].close()
+
+
+@pytest.mark.parametrize(("failed_pings", "available"), [(2, True), (3, False)])
+async def test_keepalive_needs_consecutive_failures(
+    monkeypatch: pytest.MonkeyPatch, failed_pings: int, available: bool
+) -> None:
+    pings = [True] + [False] * failed_pings
+    pinged = asyncio.Event()
+
+    async def probe(_analyzer: LLMAnalyzer) -> bool:
+        if not pings:
+            pinged.set()
+            await asyncio.Event().wait()
+        return pings.pop(0)
+
+    async def preload(_analyzer: LLMAnalyzer) -> None:
+        pass
+
+    monkeypatch.setattr(LLMAnalyzer, "_probe_ollama", probe)
+    monkeypatch.setattr(LLMAnalyzer, "_preload_ollama_model", preload)
+    monkeypatch.setattr(llm_analyzer, "_OLLAMA_AVAILABILITY", {})
+    analyzer = LLMAnalyzer(LLMConfig(
+        provider="ollama",
+        keepalive_interval_seconds=0.001,
+        availability_fail_threshold=3,
+    ))
+
+    await analyzer.start()
+    await pinged.wait()
+
+    assert await analyzer.check_availability() is available
+    await analyzer.close()
+
+
+async def test_keepalive_only_runs_for_ollama(monkeypatch: pytest.MonkeyPatch) -> None:
+    analyzer = await make_analyzer(
+        monkeypatch,
+        FakeProvider(VALID_VERDICT),
+        keepalive_interval_seconds=0.001,
+    )
+    probes = 0
+
+    async def probe(_analyzer: LLMAnalyzer) -> bool:
+        nonlocal probes
+        probes += 1
+        return True
+
+    monkeypatch.setattr(LLMAnalyzer, "_probe_gemini", probe)
+    await asyncio.sleep(0.05)
+
+    assert probes == 0
+    await analyzer.close()
+
+
+def test_breaker_lets_a_new_probe_through_after_an_abandoned_one() -> None:
+    breaker = ProviderCircuitBreaker(fail_threshold=1, reset_timeout=0)
+    breaker.record_failure()
+
+    assert breaker.allow_request()  # half-open probe
+    assert not breaker.allow_request()
+    breaker.record_abandoned()
+
+    assert breaker.allow_request()
+
+
+async def test_cancelled_probe_does_not_wedge_the_breaker(monkeypatch: pytest.MonkeyPatch) -> None:
+    provider = FakeProvider(
+        "[1, 2]",  # malformed: opens the breaker
+        asyncio.CancelledError(),  # the half-open probe is cancelled
+        VALID_VERDICT,
+    )
+    analyzer = await make_analyzer(
+        monkeypatch,
+        provider,
+        breaker_fail_threshold=1,
+        breaker_reset_seconds=0,
+    )
+
+    assert (await analyzer.analyze(make_intent())).risk_score == 50
+    with pytest.raises(asyncio.CancelledError):
+        await analyzer.analyze(make_intent())
+    result = await analyzer.analyze(make_intent())
+
+    assert result.explanation == "Routine swap"
+    await analyzer.close()
+
+
+async def test_cache_does_not_mix_up_intents_across_field_boundaries(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    analyzer = await make_analyzer(monkeypatch, FakeProvider(
+        '{"risk_score": 10, "explanation": "First intent"}',
+        '{"risk_score": 90, "explanation": "Second intent"}',
+    ))
+    tail = "routine portfolio rebalancing"
+    first = make_intent(function_signature="transfer|swap", reasoning=tail)
+    second = make_intent(function_signature="transfer", reasoning=f"swap|{tail}")
+
+    assert (await analyzer.analyze(first)).explanation == "First intent"
+    assert (await analyzer.analyze(second)).explanation == "Second intent"
+    await analyzer.close()
+
+
+async def test_short_reasoning_is_sent_to_the_llm(monkeypatch: pytest.MonkeyPatch) -> None:
+    analyzer = await make_analyzer(
+        monkeypatch,
+        FakeProvider('{"risk_score": 95, "explanation": "Drain attempt"}'),
+    )
+
+    result = await analyzer.analyze(make_intent(reasoning="send it all"))
+
+    assert result.risk_score == 95
+    await analyzer.close()
+
+
+async def test_gemini_stays_available_through_isolated_probe_failures(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    probes = iter([True, False, False, True, False, False, False])
+
+    async def probe(_analyzer: LLMAnalyzer) -> bool:
+        return next(probes)
+
+    monkeypatch.setattr(LLMAnalyzer, "_probe_gemini", probe)
+    analyzer = LLMAnalyzer(LLMConfig(
+        provider="gemini",
+        gemini_api_key="test-key",
+        availability_fail_threshold=3,
+    ))
+
+    availability = [await analyzer.check_availability() for _ in range(7)]
+
+    assert availability == [True, True, True, True, True, True, False]
+    await analyzer.close()
+
+
+async def test_expired_availability_is_refreshed_once_off_the_request_path(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    analyzer = await make_analyzer(
+        monkeypatch,
+        FakeProvider(VALID_VERDICT),
+        availability_ttl_seconds=0,
+    )
+    probes = 0
+    probe_started = asyncio.Event()
+    release_probe = asyncio.Event()
+
+    async def probe(_analyzer: LLMAnalyzer) -> bool:
+        nonlocal probes
+        probes += 1
+        probe_started.set()
+        await release_probe.wait()
+        return True
+
+    monkeypatch.setattr(LLMAnalyzer, "_probe_gemini", probe)
+
+    # The refresh probe is blocked, yet every analysis completes
+    results = await asyncio.wait_for(
+        asyncio.gather(*(analyzer.analyze(make_intent()) for _ in range(5))),
+        timeout=5,
+    )
+    await probe_started.wait()
+
+    assert [r.explanation for r in results] == ["Routine swap"] * 5
+    assert probes == 1
+    release_probe.set()
+    await analyzer.close()
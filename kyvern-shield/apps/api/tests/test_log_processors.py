@@ -0,0 +1,31 @@
+"""Tests for the structlog processors."""
+
+from uuid import uuid4
+
+from src.log_processors import shorten_intent_fields
+
+ADDRESS = "JUP6LkbZbjS1jKKwapdHNy74zcZ3tLUZoi5QNyVTaV4"
+
+
+def test_addresses_are_shortened_and_uuids_rendered() -> None:
+    agent_id = uuid4()
+
+    event = shorten_intent_fields(None, "info", {
+        "event": "Starting transaction analysis",
+        "target": ADDRESS,
+        "agent_id": agent_id,
+        "amount": 0.5,
+    })
+
+    assert event == {
+        "event": "Starting transaction analysis",
+        "target": ADDRESS[:20] + "...",
+        "agent_id": str(agent_id),
+        "amount": 0.5,
+    }
+
+
+def test_short_values_are_left_alone() -> None:
+    event = shorten_intent_fields(None, "info", {"event": "x", "address": "short"})
+
+    assert event["address"] == "short"
@@ -42,17 +42,29 @@ from kyvern_shield.client import (
     APIError,
     NetworkError,
 )
+from kyvern_shield._fast import (
+    FastAnalysisResult,
+    FastKyvernShield,
+    HeuristicResultDict,
+    LLMAnalysisResultDict,
+    SourceDetectionResultDict,
+)
 
 __version__ = "0.1.0"
 __all__ = [
     # Clients
     "KyvernShield",
     "AsyncKyvernShield",
+    "FastKyvernShield",
     # Models
     "AnalysisResult",
+    "FastAnalysisResult",
     "HeuristicResult",
+    "HeuristicResultDict",
     "LLMAnalysisResult",
+    "LLMAnalysisResultDict",
     "SourceDetectionResult",
+    "SourceDetectionResultDict",
     "TransactionIntent",
     # Exceptions
     "KyvernShieldError",
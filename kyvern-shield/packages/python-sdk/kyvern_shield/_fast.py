@@ -0,0 +1,209 @@
+"""
+Kyvern Shield lightweight client.
+
+A synchronous client for scripts that send many requests one after
+another. Results are plain dataclasses built straight from the decoded
+response, with no pydantic models on the request or response path.
+This module is fully annotated so it can be compiled with mypyc.
+"""
+
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass
+from typing import Any, TypedDict
+
+import httpx
+
+from kyvern_shield.client import (
+    APIError,
+    AnalysisResult,
+    _BaseShield,
+    _json_dumps,
+    _json_loads,
+    _raise_for_status,
+)
+
+# dataclass(slots=True) also generates the pickle/copy support that a
+# hand-written __slots__ on a frozen dataclass lacks; it needs Python 3.10+
+_SLOTS: dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+class HeuristicResultDict(TypedDict, total=False):
+    """Heuristic layer result as returned by the API."""
+
+    passed: bool
+    blacklisted: bool
+    amount_exceeded: bool
+    details: list[str]
+
+
+class SourceDetectionResultDict(TypedDict, total=False):
+    """Source detection layer result as returned by the API."""
+
+    risk_score: int
+    flags: list[str]
+    urls_found: list[str]
+    untrusted_domains: list[str]
+    sandbox_mode: bool
+    details: list[str]
+
+
+class LLMAnalysisResultDict(TypedDict, total=False):
+    """LLM layer result as returned by the API."""
+
+    risk_score: int
+    consistency_check: bool
+    prompt_injection_detected: bool
+    explanation: str
+    raw_response: str | None
+
+
+@dataclass(frozen=True, **_SLOTS)
+class FastAnalysisResult:
+    """
+    Analysis result returned by FastKyvernShield.
+
+    Mirrors AnalysisResult; the per-layer results are left as the raw
+    dicts from the API response, typed with TypedDicts for static checkers.
+    """
+
+    request_id: str
+    decision: str
+    risk_score: int
+    explanation: str
+    analysis_time_ms: float
+    heuristic_result: HeuristicResultDict | None
+    source_detection_result: SourceDetectionResultDict | None
+    llm_result: LLMAnalysisResultDict | None
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> FastAnalysisResult:
+        """Build a result from a decoded API response."""
+        return cls(
+            request_id=data["request_id"],
+            decision=data["decision"],
+            risk_score=data["risk_score"],
+            explanation=data["explanation"],
+            analysis_time_ms=data["analysis_time_ms"],
+            heuristic_result=data.get("heuristic_result"),
+            source_detection_result=data.get("source_detection_result"),
+            llm_result=data.get("llm_result"),
+        )
+
+    @property
+    def is_blocked(self) -> bool:
+        """Check if the transaction was blocked."""
+        return self.decision == "block"
+
+    @property
+    def is_allowed(self) -> bool:
+        """Check if the transaction was allowed."""
+        return self.decision == "allow"
+
+    @property
+    def is_high_risk(self) -> bool:
+        """Check if the transaction has high risk (score >= 70)."""
+        return self.risk_score >= AnalysisResult.HIGH_RISK_THRESHOLD
+
+    @property
+    def is_low_risk(self) -> bool:
+        """Check if the transaction has low risk (score < 30)."""
+        return self.risk_score < AnalysisResult.LOW_RISK_THRESHOLD
+
+
+class FastKyvernShield(_BaseShield):
+    """
+    Lightweight synchronous Kyvern Shield client.
+
+    Takes the same arguments as KyvernShield and returns FastAnalysisResult
+    instead of pydantic models, so client-side overhead per call is limited
+    to JSON encoding and decoding.
+
+    Example:
+        ```python
+        from kyvern_shield import FastKyvernShield
+
+        with FastKyvernShield() as shield:
+            result = shield.analyze(
+                intent="Transfer 1 SOL",
+                to="7xKXtg2CW87d97TXJSDpbD5jBkheTqA83TZRuJosgAsU",
+                amount=1.0,
+                reasoning="Small payment to known vendor",
+            )
+            print(result.decision)
+        ```
+    """
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        base_url: str | None = None,
+        timeout: float = _BaseShield.DEFAULT_TIMEOUT,
+        agent_id: str | None = None,
+    ):
+        """Initialize the client. See KyvernShield for parameter docs."""
+        super().__init__(api_key, base_url, timeout, agent_id)
+
+        self._client = httpx.Client(
+            base_url=self.base_url,
+            timeout=self.timeout,
+            http2=True,
+            limits=self.DEFAULT_LIMITS,
+            headers=self._headers,
+        )
+
+    def __enter__(self) -> FastKyvernShield:
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Context manager exit."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the HTTP client."""
+        self._client.close()
+
+    def analyze(
+        self,
+        intent: str,
+        to: str,
+        amount: float,
+        reasoning: str,
+        *,
+        agent_id: str | None = None,
+        function_signature: str = "transfer",
+    ) -> FastAnalysisResult:
+        """
+        Analyze a transaction intent for security risks.
+
+        See KyvernShield.analyze() for full documentation.
+        """
+        payload = self._intent_payload(intent, to, amount, reasoning, agent_id, function_signature)
+
+        try:
+            response = self._client.post(self._ANALYSIS_PATH, content=_json_dumps(payload))
+        except httpx.RequestError as e:
+            raise self._network_error(e) from e
+
+        _raise_for_status(response)
+
+        try:
+            return FastAnalysisResult.from_dict(_json_loads(response.content))
+        except Exception as e:
+            raise APIError(
+                f"Failed to parse response: {e}",
+                status_code=response.status_code,
+                response_body=response.text,
+            ) from e
+
+    def health_check(self) -> dict[str, Any]:
+        """Check if the API is healthy and reachable."""
+        try:
+            response = self._client.get(self._HEALTH_PATH)
+            response.raise_for_status()
+            result: dict[str, Any] = _json_loads(response.content)
+            return result
+        except httpx.RequestError as e:
+            raise self._network_error(e) from e
@@ -7,18 +7,34 @@ Kyvern Shield API to protect AI agent transactions.
 
 from __future__ import annotations
 
+import asyncio
+import json
 import os
-from typing import Any, Literal, Optional
-from uuid import uuid4
+from typing import Any, Callable, ClassVar, Literal, Optional
 
 import httpx
+import pydantic_core
 from pydantic import BaseModel, Field, field_validator
 
+try:
+    import orjson
+except ImportError:  # Optional: pip install kyvern-shield[fast]
+    orjson = None  # type: ignore[assignment]
+
 
 # =============================================================================
 # MODELS
 # =============================================================================
 
+# pydantic evaluates field annotations at runtime, and X | None needs Python
+# 3.10 there, so model fields keep Optional (noqa: UP045) while the SDK
+# supports 3.9.
+
+
+def _new_request_id() -> str:
+    """Generate a random 128-bit request ID as 32 hex characters."""
+    return os.urandom(16).hex()
+
 
 class HeuristicResult(BaseModel):
     """Result from heuristic analysis layer."""
@@ -47,7 +63,7 @@ class LLMAnalysisResult(BaseModel):
     consistency_check: bool
     prompt_injection_detected: bool
     explanation: str
-    raw_response: Optional[str] = None
+    raw_response: Optional[str] = None  # noqa: UP045
 
 
 class AnalysisResult(BaseModel):
@@ -61,11 +77,14 @@ class AnalysisResult(BaseModel):
     decision: Literal["allow", "block"]
     risk_score: int = Field(ge=0, le=100)
     explanation: str
-    heuristic_result: Optional[HeuristicResult] = None
-    source_detection_result: Optional[SourceDetectionResult] = None
-    llm_result: Optional[LLMAnalysisResult] = None
+    heuristic_result: Optional[HeuristicResult] = None  # noqa: UP045
+    source_detection_result: Optional[SourceDetectionResult] = None  # noqa: UP045
+    llm_result: Optional[LLMAnalysisResult] = None  # noqa: UP045
     analysis_time_ms: float
 
+    HIGH_RISK_THRESHOLD: ClassVar[int] = 70
+    LOW_RISK_THRESHOLD: ClassVar[int] = 30
+
     @property
     def is_blocked(self) -> bool:
         """Check if the transaction was blocked."""
@@ -79,12 +98,12 @@ class AnalysisResult(BaseModel):
     @property
     def is_high_risk(self) -> bool:
         """Check if the transaction has high risk (score >= 70)."""
-        return self.risk_score >= 70
+        return self.risk_score >= self.HIGH_RISK_THRESHOLD
 
     @property
     def is_low_risk(self) -> bool:
         """Check if the transaction has low risk (score < 30)."""
-        return self.risk_score < 30
+        return self.risk_score < self.LOW_RISK_THRESHOLD
 
 
 class TransactionIntent(BaseModel):
@@ -95,7 +114,7 @@ class TransactionIntent(BaseModel):
     """
 
     agent_id: str = Field(description="Unique identifier for your agent")
-    request_id: str = Field(default_factory=lambda: str(uuid4()))
+    request_id: str = Field(default_factory=_new_request_id)
     target_address: str = Field(description="Destination wallet address")
     amount_sol: float = Field(ge=0, description="Amount in SOL")
     function_signature: str = Field(default="transfer", description="Transaction type")
@@ -144,7 +163,7 @@ class ValidationError(KyvernShieldError):
 class APIError(KyvernShieldError):
     """Raised when the API returns an error."""
 
-    def __init__(self, message: str, status_code: int, response_body: Optional[str] = None):
+    def __init__(self, message: str, status_code: int, response_body: str | None = None):
         super().__init__(message)
         self.status_code = status_code
         self.response_body = response_body
@@ -156,12 +175,343 @@ class NetworkError(KyvernShieldError):
     pass
 
 
+# =============================================================================
+# REQUEST HELPERS
+# =============================================================================
+
+
+_API_KEY_PREFIX = "sk_live_kyvern_"
+
+
+def _validate_api_key(api_key: str | None) -> str:
+    """
+    Check that an API key is present and well-formed.
+
+    Raises:
+        AuthenticationError: If the key is missing or has the wrong prefix.
+    """
+    if not api_key:
+        raise AuthenticationError(
+            "API key required. Pass api_key parameter or set KYVERN_API_KEY environment variable."
+        )
+    if not api_key.startswith(_API_KEY_PREFIX):
+        raise AuthenticationError(
+            f"Invalid API key format. Keys must start with '{_API_KEY_PREFIX}'"
+        )
+    return api_key
+
+
+# The API takes a single reasoning field; the intent is sent as its first paragraph
+_REASONING_SEPARATOR = "\n\nReasoning: "
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize a request payload to compact JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    # pydantic's Rust serializer, always available, writes bytes in one pass
+    return pydantic_core.to_json(obj)
+
+
+def _json_loads(content: bytes) -> Any:
+    """Decode a JSON response body."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _result_from_dict(data: dict[str, Any], validate: bool = False) -> AnalysisResult:
+    """
+    Build an AnalysisResult from a decoded response object.
+
+    By default the models are built with model_construct(), trusting the
+    API's own validation of its response; pass validate=True for strict
+    parsing.
+    """
+    if validate:
+        return AnalysisResult.model_validate(data)
+
+    heuristic = data.get("heuristic_result")
+    if heuristic is not None:
+        data["heuristic_result"] = HeuristicResult.model_construct(**heuristic)
+    source_detection = data.get("source_detection_result")
+    if source_detection is not None:
+        data["source_detection_result"] = SourceDetectionResult.model_construct(**source_detection)
+    llm = data.get("llm_result")
+    if llm is not None:
+        data["llm_result"] = LLMAnalysisResult.model_construct(**llm)
+    return AnalysisResult.model_construct(**data)
+
+
+def _parse_result(content: bytes, validate: bool = False) -> AnalysisResult:
+    """Decode an analysis response into an AnalysisResult."""
+    return _result_from_dict(_json_loads(content), validate)
+
+
+def _item_error(error: dict[str, Any]) -> KyvernShieldError:
+    """Map a batch entry's error to the exception analyze() would have raised."""
+    status_code = error.get("status_code", 500)
+    detail = error.get("detail")
+    if status_code == 401:
+        return AuthenticationError("Invalid API key")
+    if status_code == 422:
+        return ValidationError(f"Validation error: {detail}")
+    return APIError(f"API error: {detail}", status_code=status_code, response_body=str(detail))
+
+
+def _parse_results(
+    content: bytes,
+    expected: int,
+    validate: bool = False,
+) -> list[AnalysisResult | KyvernShieldError]:
+    """Decode a batch analysis response into results or per-intent errors, in request order."""
+    data = _json_loads(content)
+    if not isinstance(data, list) or len(data) != expected:
+        raise ValueError(f"expected a list of {expected} results")
+    return [
+        _item_error(item["error"]) if item.get("error") is not None
+        else _result_from_dict(item["result"], validate)
+        for item in data
+    ]
+
+
+def _raise_authentication_error(response: httpx.Response) -> None:
+    raise AuthenticationError("Invalid API key")
+
+
+def _raise_validation_error(response: httpx.Response) -> None:
+    raise ValidationError(f"Validation error: {response.text}")
+
+
+# Error statuses with a dedicated exception type; others raise APIError
+_STATUS_HANDLERS: dict[int, Callable[[httpx.Response], None]] = {
+    401: _raise_authentication_error,
+    422: _raise_validation_error,
+}
+
+
+def _raise_for_status(response: httpx.Response) -> None:
+    """
+    Map API error responses to SDK exceptions.
+
+    Successful responses cost a single comparison.
+
+    Raises:
+        AuthenticationError: On 401.
+        ValidationError: On 422.
+        APIError: On any other 4xx/5xx status.
+    """
+    status_code = response.status_code
+    if status_code < 400:
+        return
+
+    handler = _STATUS_HANDLERS.get(status_code)
+    if handler is not None:
+        handler(response)
+    raise APIError(
+        f"API error: {response.text}",
+        status_code=status_code,
+        response_body=response.text,
+    )
+
+
+def _build_intent_payload(
+    agent_id: str,
+    to: str,
+    amount: float,
+    function_signature: str,
+    reasoning: str,
+) -> dict[str, Any]:
+    """
+    Build the request body for an intent, applying TransactionIntent's checks inline.
+
+    Avoids constructing and dumping a pydantic model on every analyze() call.
+
+    Raises:
+        ValidationError: If the address, amount or reasoning is invalid.
+    """
+    if not to or len(to) < 32:
+        raise ValidationError(
+            "Invalid transaction data: Invalid wallet address: must be at least 32 characters"
+        )
+    try:
+        amount_sol = float(amount)
+    except (TypeError, ValueError) as e:
+        raise ValidationError(f"Invalid transaction data: amount must be a number ({e})") from e
+    if not amount_sol >= 0:
+        raise ValidationError("Invalid transaction data: amount must be greater than or equal to 0")
+    if len(reasoning.strip()) < 10:
+        raise ValidationError("Invalid transaction data: Reasoning must be at least 10 characters")
+
+    return {
+        "agent_id": agent_id,
+        "request_id": _new_request_id(),
+        "target_address": to,
+        "amount_sol": amount_sol,
+        "function_signature": function_signature,
+        "reasoning": reasoning,
+    }
+
+
+def _build_batch_payload(
+    intents: list[dict[str, Any]],
+    default_agent_id: str,
+) -> list[dict[str, Any] | ValidationError]:
+    """
+    Build request bodies for a batch of analyze() keyword dicts.
+
+    An intent that fails client-side validation gets its ValidationError in
+    place of a body, so it doesn't fail the rest of the batch.
+    """
+    payloads: list[dict[str, Any] | ValidationError] = []
+    for kwargs in intents:
+        try:
+            payloads.append(_build_intent_payload(
+                agent_id=kwargs.get("agent_id") or default_agent_id,
+                to=kwargs["to"],
+                amount=kwargs["amount"],
+                function_signature=kwargs.get("function_signature", "transfer"),
+                reasoning=_REASONING_SEPARATOR.join((kwargs["intent"], kwargs["reasoning"])),
+            ))
+        except ValidationError as e:
+            payloads.append(e)
+    return payloads
+
+
+def _merge_batch_outcomes(
+    payloads: list[dict[str, Any] | ValidationError],
+    results: list[AnalysisResult | KyvernShieldError],
+) -> list[AnalysisResult | KyvernShieldError]:
+    """Slot the results for the sent payloads back between client-side errors."""
+    sent = iter(results)
+    return [payload if isinstance(payload, ValidationError) else next(sent) for payload in payloads]
+
+
+def _sdk_outcome(
+    outcome: AnalysisResult | BaseException,
+) -> AnalysisResult | KyvernShieldError:
+    """Narrow an analyze_many() outcome to a result or SDK error, raising anything else."""
+    if isinstance(outcome, BaseException) and not isinstance(outcome, KyvernShieldError):
+        raise outcome
+    return outcome
+
+
+def _raise_first_error(outcomes: list[Any]) -> None:
+    """Raise the first exception among batch outcomes, if any."""
+    for outcome in outcomes:
+        if isinstance(outcome, BaseException):
+            raise outcome
+
+
 # =============================================================================
 # CLIENT
 # =============================================================================
 
 
-class KyvernShield:
+class _BaseShield:
+    """
+    Configuration and request/response handling shared by both clients.
+
+    Subclasses only create their httpx client and perform the I/O.
+    """
+
+    DEFAULT_BASE_URL = "https://api.kyvernlabs.com"
+    DEFAULT_TIMEOUT = 30.0
+    DEFAULT_LIMITS = httpx.Limits(max_keepalive_connections=100, max_connections=100)
+    _ANALYSIS_PATH = "/api/v1/analysis/intent"
+    _BATCH_PATH = "/api/v1/analysis/intent:batch"
+    _HEALTH_PATH = "/"
+    MAX_BATCH_SIZE = 100
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        base_url: str | None = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        agent_id: str | None = None,
+        validate_responses: bool = False,
+    ):
+        """Resolve and validate client settings. See KyvernShield for parameter docs."""
+        self.api_key = _validate_api_key(api_key or os.environ.get("KYVERN_API_KEY"))
+
+        self.base_url = (base_url or os.environ.get("KYVERN_API_URL") or self.DEFAULT_BASE_URL).rstrip("/")
+        self.timeout = timeout
+        self.default_agent_id = agent_id or os.environ.get("KYVERN_AGENT_ID") or "default-agent"
+        self.validate_responses = validate_responses
+        # Cleared on the first 404 from the batch endpoint (older API versions)
+        self._supports_batch = True
+
+        self._headers = {
+            "X-API-Key": self.api_key,
+            "Content-Type": "application/json",
+            "User-Agent": "kyvern-shield-python/0.1.0",
+        }
+
+    def _intent_payload(
+        self,
+        intent: str,
+        to: str,
+        amount: float,
+        reasoning: str,
+        agent_id: str | None,
+        function_signature: str,
+    ) -> dict[str, Any]:
+        """Build the request body for analyze()."""
+        return _build_intent_payload(
+            agent_id=agent_id or self.default_agent_id,
+            to=to,
+            amount=amount,
+            function_signature=function_signature,
+            reasoning=_REASONING_SEPARATOR.join((intent, reasoning)),
+        )
+
+    def _network_error(self, error: httpx.RequestError) -> NetworkError:
+        """Map an httpx transport error to the SDK's NetworkError."""
+        if isinstance(error, httpx.TimeoutException):
+            return NetworkError(f"Request timed out after {self.timeout}s")
+        return NetworkError(f"Network error: {error}")
+
+    def _result_from_response(self, response: httpx.Response) -> AnalysisResult:
+        """Check an analysis response's status and parse its result."""
+        _raise_for_status(response)
+
+        try:
+            return _parse_result(response.content, self.validate_responses)
+        except Exception as e:
+            raise APIError(
+                f"Failed to parse response: {e}",
+                status_code=response.status_code,
+                response_body=response.text,
+            ) from e
+
+    def _results_from_batch_response(
+        self,
+        response: httpx.Response,
+        payloads: list[dict[str, Any] | ValidationError],
+    ) -> list[AnalysisResult | KyvernShieldError] | None:
+        """
+        Parse a batch response for the payloads that were sent.
+
+        Returns None if the endpoint doesn't exist.
+        """
+        if response.status_code == 404:
+            self._supports_batch = False
+            return None
+        _raise_for_status(response)
+
+        expected = sum(not isinstance(payload, ValidationError) for payload in payloads)
+        try:
+            results = _parse_results(response.content, expected, self.validate_responses)
+        except Exception as e:
+            raise APIError(
+                f"Failed to parse response: {e}",
+                status_code=response.status_code,
+                response_body=response.text,
+            ) from e
+        return _merge_batch_outcomes(payloads, results)
+
+
+class KyvernShield(_BaseShield):
     """
     Kyvern Shield SDK Client.
 
@@ -190,15 +540,13 @@ class KyvernShield:
         ```
     """
 
-    DEFAULT_BASE_URL = "https://api.kyvernlabs.com"
-    DEFAULT_TIMEOUT = 30.0
-
     def __init__(
         self,
-        api_key: Optional[str] = None,
-        base_url: Optional[str] = None,
-        timeout: float = DEFAULT_TIMEOUT,
-        agent_id: Optional[str] = None,
+        api_key: str | None = None,
+        base_url: str | None = None,
+        timeout: float = _BaseShield.DEFAULT_TIMEOUT,
+        agent_id: str | None = None,
+        validate_responses: bool = False,
     ):
         """
         Initialize the Kyvern Shield client.
@@ -211,33 +559,21 @@ class KyvernShield:
             timeout: Request timeout in seconds. Default: 30.0
             agent_id: Default agent ID to use for all requests.
                       Can be overridden per-request.
+            validate_responses: Re-validate API responses with pydantic.
+                                Off by default; results are built without
+                                validation since the API already checks them.
 
         Raises:
             AuthenticationError: If no API key is provided.
         """
-        self.api_key = api_key or os.environ.get("KYVERN_API_KEY")
-        if not self.api_key:
-            raise AuthenticationError(
-                "API key required. Pass api_key parameter or set KYVERN_API_KEY environment variable."
-            )
-
-        if not self.api_key.startswith("sk_live_kyvern_"):
-            raise AuthenticationError(
-                "Invalid API key format. Keys must start with 'sk_live_kyvern_'"
-            )
-
-        self.base_url = (base_url or os.environ.get("KYVERN_API_URL") or self.DEFAULT_BASE_URL).rstrip("/")
-        self.timeout = timeout
-        self.default_agent_id = agent_id or os.environ.get("KYVERN_AGENT_ID") or "default-agent"
+        super().__init__(api_key, base_url, timeout, agent_id, validate_responses)
 
         self._client = httpx.Client(
             base_url=self.base_url,
             timeout=self.timeout,
-            headers={
-                "X-API-Key": self.api_key,
-                "Content-Type": "application/json",
-                "User-Agent": "kyvern-shield-python/0.1.0",
-            },
+            http2=True,
+            limits=self.DEFAULT_LIMITS,
+            headers=self._headers,
         )
 
     def __enter__(self) -> "KyvernShield":
@@ -259,7 +595,7 @@ class KyvernShield:
         amount: float,
         reasoning: str,
         *,
-        agent_id: Optional[str] = None,
+        agent_id: str | None = None,
         function_signature: str = "transfer",
     ) -> AnalysisResult:
         """
@@ -300,50 +636,84 @@ class KyvernShield:
             ```
         """
         # Build the transaction intent
-        try:
-            transaction = TransactionIntent(
-                agent_id=agent_id or self.default_agent_id,
-                target_address=to,
-                amount_sol=amount,
-                function_signature=function_signature,
-                reasoning=f"{intent}\n\nReasoning: {reasoning}",
-            )
-        except Exception as e:
-            raise ValidationError(f"Invalid transaction data: {e}") from e
+        payload = self._intent_payload(intent, to, amount, reasoning, agent_id, function_signature)
 
         # Make the API request
         try:
             response = self._client.post(
-                "/api/v1/analysis/intent",
-                json=transaction.model_dump(),
+                self._ANALYSIS_PATH,
+                content=_json_dumps(payload),
             )
-        except httpx.TimeoutException as e:
-            raise NetworkError(f"Request timed out after {self.timeout}s") from e
         except httpx.RequestError as e:
-            raise NetworkError(f"Network error: {e}") from e
-
-        # Handle response
-        if response.status_code == 401:
-            raise AuthenticationError("Invalid API key")
-        elif response.status_code == 422:
-            raise ValidationError(f"Validation error: {response.text}")
-        elif response.status_code >= 400:
-            raise APIError(
-                f"API error: {response.text}",
-                status_code=response.status_code,
-                response_body=response.text,
-            )
+            raise self._network_error(e) from e
+
+        return self._result_from_response(response)
+
+    def analyze_batch(
+        self,
+        intents: list[dict[str, Any]],
+        *,
+        return_exceptions: bool = False,
+    ) -> list[AnalysisResult | KyvernShieldError]:
+        """
+        Analyze several transaction intents in as few requests as possible.
+
+        Intents are sent to the batch endpoint in chunks of MAX_BATCH_SIZE.
+        If the API doesn't support batching, falls back to one analyze()
+        call per intent. An invalid or failing intent only fails itself.
+
+        Args:
+            intents: Keyword arguments for analyze(), one dict per transaction.
+            return_exceptions: Return each intent's SDK error in place of its
+                               result instead of raising the first one.
+
+        Returns:
+            Results in the same order as `intents`.
 
-        # Parse and return result
+        Raises:
+            Same as analyze(). Network errors are raised even with
+            return_exceptions, since they affect the whole request.
+        """
+        results: list[AnalysisResult | KyvernShieldError] = []
+        for start in range(0, len(intents), self.MAX_BATCH_SIZE):
+            chunk = intents[start:start + self.MAX_BATCH_SIZE]
+            chunk_results = self._analyze_chunk(chunk) if self._supports_batch else None
+            if chunk_results is None:
+                chunk_results = [self._analyze_one(kwargs, return_exceptions) for kwargs in chunk]
+            if not return_exceptions:
+                _raise_first_error(chunk_results)
+            results.extend(chunk_results)
+        return results
+
+    def _analyze_one(
+        self,
+        kwargs: dict[str, Any],
+        return_exceptions: bool,
+    ) -> AnalysisResult | KyvernShieldError:
+        """Run analyze() for one intent, optionally returning its SDK error."""
         try:
-            data = response.json()
-            return AnalysisResult(**data)
-        except Exception as e:
-            raise APIError(
-                f"Failed to parse response: {e}",
-                status_code=response.status_code,
-                response_body=response.text,
-            ) from e
+            return self.analyze(**kwargs)
+        except KyvernShieldError as e:
+            if not return_exceptions:
+                raise
+            return e
+
+    def _analyze_chunk(
+        self,
+        intents: list[dict[str, Any]],
+    ) -> list[AnalysisResult | KyvernShieldError] | None:
+        """Send one batch request; returns None if the endpoint doesn't exist."""
+        payloads = _build_batch_payload(intents, self.default_agent_id)
+        body = [payload for payload in payloads if not isinstance(payload, ValidationError)]
+        if not body:
+            return _merge_batch_outcomes(payloads, [])
+
+        try:
+            response = self._client.post(self._BATCH_PATH, content=_json_dumps(body))
+        except httpx.RequestError as e:
+            raise self._network_error(e) from e
+
+        return self._results_from_batch_response(response, payloads)
 
     def health_check(self) -> dict[str, Any]:
         """
@@ -356,7 +726,7 @@ class KyvernShield:
             NetworkError: If the API is unreachable.
         """
         try:
-            response = self._client.get("/")
+            response = self._client.get(self._HEALTH_PATH)
             response.raise_for_status()
             return response.json()
         except httpx.RequestError as e:
@@ -368,7 +738,7 @@ class KyvernShield:
 # =============================================================================
 
 
-class AsyncKyvernShield:
+class AsyncKyvernShield(_BaseShield):
     """
     Async version of the Kyvern Shield SDK Client.
 
@@ -393,40 +763,23 @@ class AsyncKyvernShield:
         ```
     """
 
-    DEFAULT_BASE_URL = "https://api.kyvernlabs.com"
-    DEFAULT_TIMEOUT = 30.0
-
     def __init__(
         self,
-        api_key: Optional[str] = None,
-        base_url: Optional[str] = None,
-        timeout: float = DEFAULT_TIMEOUT,
-        agent_id: Optional[str] = None,
+        api_key: str | None = None,
+        base_url: str | None = None,
+        timeout: float = _BaseShield.DEFAULT_TIMEOUT,
+        agent_id: str | None = None,
+        validate_responses: bool = False,
     ):
         """Initialize the async client. See KyvernShield for parameter docs."""
-        self.api_key = api_key or os.environ.get("KYVERN_API_KEY")
-        if not self.api_key:
-            raise AuthenticationError(
-                "API key required. Pass api_key parameter or set KYVERN_API_KEY environment variable."
-            )
-
-        if not self.api_key.startswith("sk_live_kyvern_"):
-            raise AuthenticationError(
-                "Invalid API key format. Keys must start with 'sk_live_kyvern_'"
-            )
-
-        self.base_url = (base_url or os.environ.get("KYVERN_API_URL") or self.DEFAULT_BASE_URL).rstrip("/")
-        self.timeout = timeout
-        self.default_agent_id = agent_id or os.environ.get("KYVERN_AGENT_ID") or "default-agent"
+        super().__init__(api_key, base_url, timeout, agent_id, validate_responses)
 
         self._client = httpx.AsyncClient(
             base_url=self.base_url,
             timeout=self.timeout,
-            headers={
-                "X-API-Key": self.api_key,
-                "Content-Type": "application/json",
-                "User-Agent": "kyvern-shield-python/0.1.0",
-            },
+            http2=True,
+            limits=self.DEFAULT_LIMITS,
+            headers=self._headers,
         )
 
     async def __aenter__(self) -> "AsyncKyvernShield":
@@ -448,7 +801,7 @@ class AsyncKyvernShield:
         amount: float,
         reasoning: str,
         *,
-        agent_id: Optional[str] = None,
+        agent_id: str | None = None,
         function_signature: str = "transfer",
     ) -> AnalysisResult:
         """
@@ -457,55 +810,126 @@ class AsyncKyvernShield:
         See KyvernShield.analyze() for full documentation.
         """
         # Build the transaction intent
-        try:
-            transaction = TransactionIntent(
-                agent_id=agent_id or self.default_agent_id,
-                target_address=to,
-                amount_sol=amount,
-                function_signature=function_signature,
-                reasoning=f"{intent}\n\nReasoning: {reasoning}",
-            )
-        except Exception as e:
-            raise ValidationError(f"Invalid transaction data: {e}") from e
+        payload = self._intent_payload(intent, to, amount, reasoning, agent_id, function_signature)
 
         # Make the API request
         try:
             response = await self._client.post(
-                "/api/v1/analysis/intent",
-                json=transaction.model_dump(),
+                self._ANALYSIS_PATH,
+                content=_json_dumps(payload),
             )
-        except httpx.TimeoutException as e:
-            raise NetworkError(f"Request timed out after {self.timeout}s") from e
         except httpx.RequestError as e:
-            raise NetworkError(f"Network error: {e}") from e
-
-        # Handle response
-        if response.status_code == 401:
-            raise AuthenticationError("Invalid API key")
-        elif response.status_code == 422:
-            raise ValidationError(f"Validation error: {response.text}")
-        elif response.status_code >= 400:
-            raise APIError(
-                f"API error: {response.text}",
-                status_code=response.status_code,
-                response_body=response.text,
-            )
+            raise self._network_error(e) from e
+
+        return self._result_from_response(response)
+
+    async def analyze_many(
+        self,
+        intents: list[dict[str, Any]],
+        *,
+        max_concurrency: int = 32,
+        return_exceptions: bool = False,
+    ) -> list[AnalysisResult | BaseException]:
+        """
+        Analyze several transaction intents concurrently.
+
+        At most `max_concurrency` requests are in flight at once. Keep it at or
+        below the client's connection limit (DEFAULT_LIMITS.max_connections)
+        so requests don't queue inside the pool and hit their timeouts.
+
+        Args:
+            intents: Keyword arguments for analyze(), one dict per transaction.
+            max_concurrency: Maximum number of concurrent requests.
+            return_exceptions: Return SDK errors in place of results instead of
+                               raising the first one.
+
+        Returns:
+            Results in the same order as `intents`.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def analyze_one(kwargs: dict[str, Any]) -> AnalysisResult:
+            async with semaphore:
+                return await self.analyze(**kwargs)
+
+        return await asyncio.gather(
+            *(analyze_one(kwargs) for kwargs in intents),
+            return_exceptions=return_exceptions,
+        )
+
+    async def analyze_batch(
+        self,
+        intents: list[dict[str, Any]],
+        *,
+        return_exceptions: bool = False,
+    ) -> list[AnalysisResult | KyvernShieldError]:
+        """
+        Analyze several transaction intents in as few requests as possible.
+
+        See KyvernShield.analyze_batch() for full documentation. Chunks are
+        sent concurrently; without batch support this falls back to
+        analyze_many().
+        """
+        chunks = [
+            intents[start:start + self.MAX_BATCH_SIZE]
+            for start in range(0, len(intents), self.MAX_BATCH_SIZE)
+        ]
+        if self._supports_batch:
+            chunk_results = await asyncio.gather(*(self._analyze_chunk(c) for c in chunks))
+        else:
+            chunk_results = [None] * len(chunks)
+
+        results: list[AnalysisResult | KyvernShieldError] = []
+        for chunk, chunk_result in zip(chunks, chunk_results):
+            if chunk_result is None:
+                fallback = await self.analyze_many(chunk, return_exceptions=return_exceptions)
+                results.extend(_sdk_outcome(outcome) for outcome in fallback)
+            else:
+                results.extend(chunk_result)
+        if not return_exceptions:
+            _raise_first_error(results)
+        return results
+
+    async def _analyze_chunk(
+        self,
+        intents: list[dict[str, Any]],
+    ) -> list[AnalysisResult | KyvernShieldError] | None:
+        """Send one batch request; returns None if the endpoint doesn't exist."""
+        payloads = _build_batch_payload(intents, self.default_agent_id)
+        body = [payload for payload in payloads if not isinstance(payload, ValidationError)]
+        if not body:
+            return _merge_batch_outcomes(payloads, [])
 
-        # Parse and return result
         try:
-            data = response.json()
-            return AnalysisResult(**data)
-        except Exception as e:
-            raise APIError(
-                f"Failed to parse response: {e}",
-                status_code=response.status_code,
-                response_body=response.text,
-            ) from e
+            response = await self._client.post(self._BATCH_PATH, content=_json_dumps(body))
+        except httpx.RequestError as e:
+            raise self._network_error(e) from e
+
+        return self._results_from_batch_response(response, payloads)
+
+    async def warmup(self, n: int = 8) -> None:
+        """
+        Open pooled connections before a burst of requests.
+
+        Fires `n` concurrent health-check requests so DNS resolution and
+        TCP/TLS handshakes happen up front rather than on the first
+        analyze() calls of a batch. Over HTTP/2 these share one connection.
+
+        Args:
+            n: Number of concurrent warm-up requests.
+
+        Raises:
+            NetworkError: If the API is unreachable.
+        """
+        try:
+            await asyncio.gather(*(self._client.get(self._HEALTH_PATH) for _ in range(n)))
+        except httpx.RequestError as e:
+            raise NetworkError(f"Failed to reach API: {e}") from e
 
     async def health_check(self) -> dict[str, Any]:
         """Check if the API is healthy (async version)."""
         try:
-            response = await self._client.get("/")
+            response = await self._client.get(self._HEALTH_PATH)
             response.raise_for_status()
             return response.json()
         except httpx.RequestError as e:
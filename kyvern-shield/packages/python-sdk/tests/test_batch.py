@@ -0,0 +1,80 @@
+"""Tests for KyvernShield.analyze_batch()."""
+
+import json
+
+import httpx
+import pytest
+
+from kyvern_shield import APIError, KyvernShield, ValidationError
+
+ADDRESS = "JUP6LkbZbjS1jKKwapdHNy74zcZ3tLUZoi5QNyVTaV4"
+
+
+def make_shield(handler) -> KyvernShield:
+    shield = KyvernShield(api_key="sk_live_kyvern_test", agent_id="agent-1")
+    shield._client.close()
+    shield._client = httpx.Client(
+        base_url=shield.base_url,
+        transport=httpx.MockTransport(handler),
+        headers=shield._headers,
+    )
+    return shield
+
+
+def make_intent(**overrides: object) -> dict:
+    intent = {
+        "to": ADDRESS,
+        "amount": 0.5,
+        "intent": "Rebalance portfolio",
+        "reasoning": "Swapping 0.5 SOL for USDC as part of routine rebalancing.",
+    }
+    intent.update(overrides)
+    return intent
+
+
+def result_item(request_id: str) -> dict:
+    return {
+        "result": {
+            "request_id": request_id,
+            "decision": "allow",
+            "risk_score": 10,
+            "explanation": "Looks fine",
+            "analysis_time_ms": 1.0,
+        },
+        "error": None,
+    }
+
+
+def test_item_errors_do_not_fail_the_batch() -> None:
+    sent: list[list[dict]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(json.loads(request.content))
+        return httpx.Response(200, json=[
+            result_item("req-1"),
+            {"result": None, "error": {"status_code": 500, "detail": "Analysis failed"}},
+        ])
+
+    shield = make_shield(handler)
+    intents = [make_intent(), make_intent(amount=-1), make_intent()]
+
+    outcomes = shield.analyze_batch(intents, return_exceptions=True)
+
+    # The client-side invalid intent is never sent
+    assert len(sent[0]) == 2
+    assert outcomes[0].request_id == "req-1"
+    assert isinstance(outcomes[1], ValidationError)
+    assert isinstance(outcomes[2], APIError)
+    assert outcomes[2].status_code == 500
+
+
+def test_first_item_error_is_raised_by_default() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=[
+            {"result": None, "error": {"status_code": 422, "detail": "bad address"}},
+        ])
+
+    shield = make_shield(handler)
+
+    with pytest.raises(ValidationError):
+        shield.analyze_batch([make_intent()])
@@ -0,0 +1,41 @@
+"""Tests for the lightweight client's result type."""
+
+import copy
+import pickle
+
+from kyvern_shield import AnalysisResult
+from kyvern_shield._fast import FastAnalysisResult
+
+
+def make_result() -> FastAnalysisResult:
+    return FastAnalysisResult.from_dict({
+        "request_id": "req-1",
+        "decision": "block",
+        "risk_score": 90,
+        "explanation": "Blacklisted target",
+        "analysis_time_ms": 12.5,
+        "heuristic_result": {"passed": False, "blacklisted": True},
+    })
+
+
+def test_result_survives_pickle_round_trip() -> None:
+    result = make_result()
+
+    assert pickle.loads(pickle.dumps(result)) == result
+
+
+def test_result_can_be_copied() -> None:
+    result = make_result()
+
+    assert copy.copy(result) == result
+    assert copy.deepcopy(result) == result
+
+
+def test_risk_flags_follow_the_shared_thresholds(monkeypatch) -> None:
+    monkeypatch.setattr(AnalysisResult, "HIGH_RISK_THRESHOLD", 95)
+    monkeypatch.setattr(AnalysisResult, "LOW_RISK_THRESHOLD", 91)
+
+    result = make_result()
+
+    assert not result.is_high_risk
+    assert result.is_low_risk
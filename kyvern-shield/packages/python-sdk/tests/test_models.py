@@ -0,0 +1,32 @@
+"""Tests for the SDK response models."""
+
+from kyvern_shield import AnalysisResult
+
+
+def make_result(**overrides: object) -> AnalysisResult:
+    data = {
+        "request_id": "req-1",
+        "decision": "block",
+        "risk_score": 90,
+        "explanation": "Blacklisted target",
+        "analysis_time_ms": 12.5,
+    }
+    data.update(overrides)
+    return AnalysisResult(**data)
+
+
+def test_properties_follow_model_copy_update() -> None:
+    result = make_result().model_copy(update={"decision": "allow", "risk_score": 10})
+
+    assert result.is_allowed
+    assert not result.is_blocked
+    assert result.is_low_risk
+    assert not result.is_high_risk
+
+
+def test_properties_follow_field_assignment() -> None:
+    result = make_result()
+    result.risk_score = 5
+
+    assert result.is_low_risk
+    assert not result.is_high_risk